@@ -11,9 +11,9 @@ This system demonstrates:
 Main components:
 - ParkingLot: Main system orchestrator
 - Floor: Represents each floor of the parking structure
-- ParkingSlot: Individual parking spaces
+- Slot: Individual parking spaces
 - Vehicle: Vehicles to be parked
-- ParkingTicket: Entry/exit ticket management
+- Ticket: Entry/exit ticket management
 - Payment: Payment processing
 - SlotAssignmentStrategy: Pluggable strategies for slot allocation
 """
@@ -21,16 +21,15 @@ Main components:
 from models import (
     ParkingLot,
     Floor,
-    ParkingSlot,
+    Slot,
+    Gate,
     Vehicle,
-    ParkingTicket,
+    Ticket,
     Payment,
     VehicleType,
-    ParkingSlotStatus,
+    SlotStatus,
     ParkingLotStatus,
     SlotAssignmentStrategy,
-    NearestSlotStrategy,
-    OptimizedSlotStrategy,
 )
 
 __version__ = "1.0.0"
@@ -39,14 +38,13 @@ __author__ = "Design Patterns - LLD Games"
 __all__ = [
     'ParkingLot',
     'Floor',
-    'ParkingSlot',
+    'Slot',
+    'Gate',
     'Vehicle',
-    'ParkingTicket',
+    'Ticket',
     'Payment',
     'VehicleType',
-    'ParkingSlotStatus',
+    'SlotStatus',
     'ParkingLotStatus',
     'SlotAssignmentStrategy',
-    'NearestSlotStrategy',
-    'OptimizedSlotStrategy',
 ]
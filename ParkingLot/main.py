@@ -6,85 +6,119 @@ with multiple floors, different vehicle types, and smart slot assignment.
 
 Features:
 - Multiple floors support
-- Multiple vehicle types (Motorcycle, Car, Truck)
+- Multiple vehicle types (Bike, Car, Truck)
 - Automatic slot assignment strategies
 - Ticket and payment management
 - Real-time availability tracking
 """
 
+import time
+from collections import Counter
+from datetime import datetime
+
 from models.models import (
-    ParkingLot, Floor, ParkingSlot, Vehicle, ParkingTicket, Payment,
-    VehicleType, PaymentMethod, NearestSlotStrategy, OptimizedSlotStrategy
+    ParkingLot, Floor, Slot, Gate, Vehicle, Payment,
+    ParkingLotStatus, FloorStatus, GateStatus, GateType,
+    VehicleType, SlotStatus, PaymentMode, PaymentStatus, SlotAssignmentStrategy
 )
+from repository.GateRepo import GateRepo
+from repository.ParkingLotRepo import ParkingLotRepo
+from repository.SlotRepo import SlotRepo
+from repository.TicketRepo import TicketRepo
+from repository.VehicleRepo import VehicleRepo
+from service.TicketService import TicketService
+from strgy.FeeCalculator import compute_fee
+
+SEPARATOR = "=" * 60
+ENTRY_GATE_ID = 1
 
 def setup_parking_lot():
     """Initialize and setup a complete parking lot with floors and slots"""
     
     # Create parking lot with strategy
     parking_lot = ParkingLot(
+        id=1,
         name="Sky High Parking",
         address="123 Main Street, Tech City",
-        slot_assignment_strategy=NearestSlotStrategy()
+        floors=[],
+        gates=[],
+        allowed_vehicles=[VehicleType.BIKE, VehicleType.CAR, VehicleType.TRUCK],
+        capacity=24,
+        status=ParkingLotStatus.OPEN,
+        slot_assignment_strategy=SlotAssignmentStrategy.NEAREST,
     )
     
     # Add 3 floors
+    slot_id = 0
     for floor_num in range(1, 4):
-        floor = Floor(floor_number=floor_num, parking_lot=parking_lot)
-        
-        # Add motorcycle slots (2 per floor)
-        for slot_num in range(1, 3):
-            slot = ParkingSlot(
-                slot_number=slot_num,
-                vehicle_type=VehicleType.MOTORCYCLE,
-                floor=floor
-            )
-            floor.add_parking_slot(slot)
-        
-        # Add car slots (4 per floor)
-        for slot_num in range(3, 7):
-            slot = ParkingSlot(
-                slot_number=slot_num,
-                vehicle_type=VehicleType.CAR,
-                floor=floor
-            )
-            floor.add_parking_slot(slot)
+        floor = Floor(
+            id=floor_num,
+            floor_number=floor_num,
+            slots=[],
+            status=FloorStatus.OPEN,
+            allowed_vehicles=parking_lot.allowed_vehicles,
+        )
         
-        # Add truck slots (2 per floor)
-        for slot_num in range(7, 9):
-            slot = ParkingSlot(
+        # Bike slots 1-2, car slots 3-6, truck slots 7-8
+        for slot_num in range(1, 9):
+            if slot_num <= 2:
+                vehicle_type = VehicleType.BIKE
+            elif slot_num <= 6:
+                vehicle_type = VehicleType.CAR
+            else:
+                vehicle_type = VehicleType.TRUCK
+            slot_id += 1
+            slot = Slot(
+                id=slot_id,
                 slot_number=slot_num,
-                vehicle_type=VehicleType.TRUCK,
-                floor=floor
+                vehicle_type=vehicle_type,
+                status=SlotStatus.EMPTY,
+                floor=floor,
             )
             floor.add_parking_slot(slot)
         
         parking_lot.add_floor(floor)
     
+    gate = Gate(
+        id=ENTRY_GATE_ID,
+        gate_number=1,
+        gate_type=GateType.ENTRY,
+        parking_lot=parking_lot,
+        status=GateStatus.OPEN,
+    )
+    parking_lot.gates.append(gate)
+    
     return parking_lot
 
+def setup_ticket_service(parking_lot):
+    """Wire the ticket service with in-memory repositories"""
+    gate_repo = GateRepo()
+    for gate in parking_lot.gates:
+        gate_repo.save_gate(gate)
+    return TicketService(gate_repo, VehicleRepo(), SlotRepo(), ParkingLotRepo(), TicketRepo())
+
 def demo_basic_operations(parking_lot):
     """Demonstrate basic parking lot operations"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("DEMO 1: Basic Parking Operations")
-    print("="*60)
+    print(SEPARATOR)
     
     # Create vehicles
     vehicles = [
-        Vehicle("DL01AB1234", VehicleType.CAR),
-        Vehicle("DL02CD5678", VehicleType.MOTORCYCLE),
-        Vehicle("DL03EF9012", VehicleType.CAR),
-        Vehicle("DL04GH3456", VehicleType.TRUCK),
-        Vehicle("DL05IJ7890", VehicleType.MOTORCYCLE),
-        Vehicle("DL06KL2345", VehicleType.CAR),
+        Vehicle(1, "DL01AB1234", "Asha", VehicleType.CAR),
+        Vehicle(2, "DL02CD5678", "Ravi", VehicleType.BIKE),
+        Vehicle(3, "DL03EF9012", "Meera", VehicleType.CAR),
+        Vehicle(4, "DL04GH3456", "Arjun", VehicleType.TRUCK),
+        Vehicle(5, "DL05IJ7890", "Kiran", VehicleType.BIKE),
+        Vehicle(6, "DL06KL2345", "Neha", VehicleType.CAR),
     ]
     
     # Park vehicles
     print("\n--- Parking Vehicles ---")
-    tickets = []
-    for vehicle in vehicles:
-        ticket = parking_lot.park_vehicle(vehicle, floor_number=1)
-        if ticket:
-            tickets.append(ticket)
+    tickets = parking_lot.park_vehicles_batch(vehicles, floor_number=1)
+    for ticket in tickets:
+        print(f"✓ Vehicle {ticket.vehicle.registration_number} parked at "
+              f"Floor {ticket.slot.floor.floor_number}, Slot {ticket.slot.slot_number}")
     
     # Display lot status
     parking_lot.display_lot_status()
@@ -93,9 +127,9 @@ def demo_basic_operations(parking_lot):
 
 def demo_unpark_vehicles(parking_lot, tickets):
     """Demonstrate unparking and fee collection"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("DEMO 2: Unparking Vehicles & Fee Collection")
-    print("="*60)
+    print(SEPARATOR)
     
     if not tickets:
         print("No tickets to process")
@@ -108,84 +142,100 @@ def demo_unpark_vehicles(parking_lot, tickets):
         vehicle_reg = ticket.vehicle.registration_number
         
         # Simulate time passage (in real system)
-        fee = parking_lot.unpark_vehicle(vehicle_reg)
+        closed_ticket = parking_lot.unpark_vehicle(vehicle_reg)
         
-        if fee:
+        if closed_ticket:
+            fee = compute_fee(closed_ticket, time.time())
             # Process payment
-            payment = Payment(amount=fee, method=PaymentMethod.CREDIT_CARD)
-            payment.process_payment()
-            print(f"  Payment processed: {payment}")
+            payment = Payment(
+                id=i + 1,
+                amount=fee,
+                mode=PaymentMode.CARD,
+                ref_id=f"PAY-{vehicle_reg}",
+                bill=None,
+                status=PaymentStatus.SUCCESS,
+                paid_at=datetime.now(),
+            )
+            parking_lot.record_payment(payment)
+            print(f"  {vehicle_reg} paid ₹{payment.amount} by {payment.mode.value}")
     
     # Display updated lot status
     parking_lot.display_lot_status()
 
 def demo_slot_availability(parking_lot):
     """Demonstrate slot availability checking"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("DEMO 3: Slot Availability Tracking")
-    print("="*60)
+    print(SEPARATOR)
     
     print("\n--- Available Slots by Type ---")
-    print(f"Motorcycles: {parking_lot.get_available_slots_count(VehicleType.MOTORCYCLE)} slots")
+    print(f"Bikes: {parking_lot.get_available_slots_count(VehicleType.BIKE)} slots")
     print(f"Cars: {parking_lot.get_available_slots_count(VehicleType.CAR)} slots")
     print(f"Trucks: {parking_lot.get_available_slots_count(VehicleType.TRUCK)} slots")
 
-def demo_strategy_switching(parking_lot):
+def demo_strategy_switching(parking_lot, ticket_service):
     """Demonstrate changing slot assignment strategy"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("DEMO 4: Slot Assignment Strategy Switching")
-    print("="*60)
+    print(SEPARATOR)
     
     # Switch to optimized strategy
-    parking_lot.slot_assignment_strategy = OptimizedSlotStrategy()
+    parking_lot.slot_assignment_strategy = SlotAssignmentStrategy.OPTIMIZED
     print("\n✓ Switched to Optimized Strategy (prefers slots away from entrance)")
     
     # Park new vehicles with new strategy
     print("\n--- Parking with Optimized Strategy ---")
     new_vehicles = [
-        Vehicle("DL07MN5678", VehicleType.CAR),
-        Vehicle("DL08OP9012", VehicleType.MOTORCYCLE),
+        ("DL07MN5678", "Vikram", VehicleType.CAR),
+        ("DL08OP9012", "Divya", VehicleType.BIKE),
     ]
     
-    for vehicle in new_vehicles:
-        ticket = parking_lot.park_vehicle(vehicle, floor_number=2)
-        if ticket:
-            print(f"  {ticket.vehicle.registration_number} assigned to {ticket.parking_slot}")
+    for vehicle_number, owner_name, vehicle_type in new_vehicles:
+        ticket = ticket_service.issueTicket(vehicle_number, owner_name, ENTRY_GATE_ID, vehicle_type)
+        print(f"  {ticket.number}: {ticket.vehicle.registration_number} assigned to "
+              f"Floor {ticket.slot.floor.floor_number}, Slot {ticket.slot.slot_number}")
 
 def demo_statistics(parking_lot):
     """Display parking lot statistics"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("DEMO 5: Parking Lot Statistics")
-    print("="*60)
+    print(SEPARATOR)
     
-    total_slots = sum(
-        len(floor.parking_slots) for floor in parking_lot.floors.values()
-    )
+    # (vehicle_type, status) -> count, merged from each floor's running
+    # counts; every per-type / per-status figure below is a dict read
+    slot_counts = Counter()
+    for floor in parking_lot.sorted_floors:
+        slot_counts.update(floor.slot_counts)
+    slots_by_type = Counter()
+    for (vehicle_type, _), count in slot_counts.items():
+        slots_by_type[vehicle_type] += count
     
     print(f"\n--- Lot Statistics ---")
     print(f"Total Floors: {len(parking_lot.floors)}")
-    print(f"Total Parking Slots: {total_slots}")
-    print(f"  - Motorcycle Slots: {sum(1 for floor in parking_lot.floors.values() for slot in floor.parking_slots.values() if slot.vehicle_type == VehicleType.MOTORCYCLE)}")
-    print(f"  - Car Slots: {sum(1 for floor in parking_lot.floors.values() for slot in floor.parking_slots.values() if slot.vehicle_type == VehicleType.CAR)}")
-    print(f"  - Truck Slots: {sum(1 for floor in parking_lot.floors.values() for slot in floor.parking_slots.values() if slot.vehicle_type == VehicleType.TRUCK)}")
+    print(f"Total Parking Slots: {sum(slot_counts.values())}")
+    for label, vehicle_type in (
+        ("Bike", VehicleType.BIKE),
+        ("Car", VehicleType.CAR),
+        ("Truck", VehicleType.TRUCK),
+    ):
+        print(f"  - {label} Slots: {slots_by_type[vehicle_type]} "
+              f"({slot_counts[(vehicle_type, SlotStatus.EMPTY)]} free)")
     
-    print(f"\nCurrently Parked Vehicles: {len(parking_lot.parked_vehicles)}")
+    print(f"\nPayments Collected: {len(parking_lot.payment_amounts)}")
+    print(f"Total Revenue: ₹{parking_lot.total_revenue}")
+    print(f"Currently Parked Vehicles: {len(parking_lot.parked_vehicles)}")
     print(f"Active Tickets: {len(parking_lot.active_tickets)}")
-    print(f"Completed Transactions: {len(parking_lot.completed_tickets)}")
-    
-    if parking_lot.completed_tickets:
-        total_vehicles = len(parking_lot.completed_tickets)
-        print(f"Total Parking Duration Tracked: {total_vehicles} vehicles")
 
 def main():
     """Main execution"""
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("PARKING LOT MANAGEMENT SYSTEM - COMPLETE DEMO")
-    print("="*60)
+    print(SEPARATOR)
     
     # Setup parking lot
     parking_lot = setup_parking_lot()
-    print(f"\n✓ Parking lot initialized: {parking_lot}")
+    ticket_service = setup_ticket_service(parking_lot)
+    print(f"\n✓ Parking lot initialized: {parking_lot.name}")
     print(f"✓ Address: {parking_lot.address}")
     print(f"✓ Floors: {len(parking_lot.floors)}")
     
@@ -193,18 +243,18 @@ def main():
     tickets = demo_basic_operations(parking_lot)
     demo_slot_availability(parking_lot)
     demo_unpark_vehicles(parking_lot, tickets)
-    demo_strategy_switching(parking_lot)
+    demo_strategy_switching(parking_lot, ticket_service)
     demo_statistics(parking_lot)
     
     # Final status
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("FINAL PARKING LOT STATUS")
-    print("="*60)
+    print(SEPARATOR)
     parking_lot.display_lot_status()
     
-    print("\n" + "="*60)
+    print("\n" + SEPARATOR)
     print("✓ DEMO COMPLETED SUCCESSFULLY")
-    print("="*60 + "\n")
+    print(SEPARATOR + "\n")
 
 if __name__ == "__main__":
     main()
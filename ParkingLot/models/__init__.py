@@ -2,45 +2,50 @@
 
 from .models import (
     # Enums
-    VehicleType,
-    ParkingSlotStatus,
-    FloorStatus,
     ParkingLotStatus,
+    FloorStatus,
+    GateStatus,
+    GateType,
+    VehicleType,
+    SlotStatus,
+    BillStatus,
     PaymentStatus,
-    PaymentMethod,
-    TicketStatus,
+    PaymentMode,
+    SlotAssignmentStrategy,
     # Base
     BaseModel,
     # Core Classes
-    Vehicle,
-    ParkingSlot,
+    ParkingLot,
     Floor,
+    Slot,
+    Gate,
+    Vehicle,
+    Ticket,
+    Bill,
     Payment,
-    ParkingTicket,
-    # Strategies
-    SlotAssignmentStrategy,
-    NearestSlotStrategy,
-    OptimizedSlotStrategy,
-    # Main
-    ParkingLot,
+    # Helpers
+    normalize_registration,
 )
 
 __all__ = [
-    'VehicleType',
-    'ParkingSlotStatus',
-    'FloorStatus',
     'ParkingLotStatus',
+    'FloorStatus',
+    'GateStatus',
+    'GateType',
+    'VehicleType',
+    'SlotStatus',
+    'BillStatus',
     'PaymentStatus',
-    'PaymentMethod',
-    'TicketStatus',
+    'PaymentMode',
+    'SlotAssignmentStrategy',
     'BaseModel',
-    'Vehicle',
-    'ParkingSlot',
+    'ParkingLot',
     'Floor',
+    'Slot',
+    'Gate',
+    'Vehicle',
+    'Ticket',
+    'Bill',
     'Payment',
-    'ParkingTicket',
-    'SlotAssignmentStrategy',
-    'NearestSlotStrategy',
-    'OptimizedSlotStrategy',
-    'ParkingLot',
+    'normalize_registration',
 ]
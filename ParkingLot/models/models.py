@@ -1,6 +1,42 @@
+import math
+import random
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
 from datetime import datetime
-from enum import Enum
-from typing import List
+from enum import Enum, IntEnum
+from typing import Dict, List, Optional, Tuple
+
+
+# ============================================================
+# Helpers
+# ============================================================
+
+ZORDER_MAX = 0xFFFF
+PAYMENT_AMOUNT_MAX = 2 ** 63 - 1
+
+
+def _spread_bits(v: int) -> int:
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def check_coordinates(x: int, y: int):
+    if not (0 <= x <= ZORDER_MAX and 0 <= y <= ZORDER_MAX):
+        raise ValueError(f"coordinates must be within 0..{ZORDER_MAX}, got ({x}, {y})")
+
+
+def zorder(x: int, y: int) -> int:
+    # Morton code of a (x, y) in 0..65535: points inside an axis-aligned box
+    # always fall between the codes of its lower-left and upper-right corners
+    check_coordinates(x, y)
+    return _spread_bits(x) | (_spread_bits(y) << 1)
 
 
 # ============================================================
@@ -8,28 +44,46 @@ from typing import List
 # ============================================================
 
 class BaseModel:
-    def __init__(self, id: int):
+    __slots__ = ('id', '_created_ts', '_updated_ts')
+
+    def __init__(self, id: int, ts: Optional[float] = None):
         self.id = id
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # epoch seconds; datetime objects are only built when asked for.
+        # Subclasses that already read the clock pass it in as ts.
+        self._created_ts = self._updated_ts = time.time() if ts is None else ts
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._created_ts)
+
+    @property
+    def updated_at(self) -> datetime:
+        return datetime.fromtimestamp(self._updated_ts)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self._updated_ts = value.timestamp()
+
+    def touch(self, ts: Optional[float] = None):
+        self._updated_ts = time.time() if ts is None else ts
 
 
 # ============================================================
 # Enums — Parking Infra
 # ============================================================
 
-class ParkingLotStatus(Enum):
-    OPEN = "OPEN"
-    CLOSED = "CLOSED"
-    FULL = "FULL"
-    UNDER_MAINTENANCE = "UNDER_MAINTENANCE"
+class ParkingLotStatus(IntEnum):
+    OPEN = 1
+    CLOSED = 2
+    FULL = 3
+    UNDER_MAINTENANCE = 4
 
 
-class FloorStatus(Enum):
-    OPEN = "OPEN"
-    CLOSED = "CLOSED"
-    FULL = "FULL"
-    UNDER_MAINTENANCE = "UNDER_MAINTENANCE"
+class FloorStatus(IntEnum):
+    OPEN = 1
+    CLOSED = 2
+    FULL = 3
+    UNDER_MAINTENANCE = 4
 
 
 class GateStatus(Enum):
@@ -47,18 +101,21 @@ class GateType(Enum):
 # Enums — Slot / Vehicle
 # ============================================================
 
-class VehicleType(Enum):
-    CAR = "CAR"
-    BIKE = "BIKE"
-    BUS = "BUS"
-    TRUCK = "TRUCK"
+# IntEnum: these are compared and used as dict keys on every slot lookup,
+# so keep them as plain ints rather than going through Enum.__eq__/__hash__.
 
+class VehicleType(IntEnum):
+    CAR = 1
+    BIKE = 2
+    BUS = 3
+    TRUCK = 4
 
-class SlotStatus(Enum):
-    EMPTY = "EMPTY"
-    FILLED = "FILLED"
-    RESERVED = "RESERVED"
-    BLOCKED = "BLOCKED"
+
+class SlotStatus(IntEnum):
+    EMPTY = 1
+    FILLED = 2
+    RESERVED = 3
+    BLOCKED = 4
 
 
 # ============================================================
@@ -89,6 +146,8 @@ class PaymentMode(Enum):
 
 class SlotAssignmentStrategy(Enum):
     RANDOM = "RANDOM"
+    NEAREST = "NEAREST"
+    OPTIMIZED = "OPTIMIZED"
 
 
 # ============================================================
@@ -96,6 +155,28 @@ class SlotAssignmentStrategy(Enum):
 # ============================================================
 
 class ParkingLot(BaseModel):
+    __slots__ = (
+        'name',
+        'address',
+        'floors',
+        'gates',
+        'allowed_vehicles',
+        'capacity',
+        'status',
+        'slot_assignment_strategy',
+        'total_slot_count',
+        'total_by_type',
+        'available_by_type',
+        'active_tickets',
+        'parked_vehicles',
+        'tickets_lock',
+        'sorted_floors',
+        'reversed_floors',
+        'counter_lock',
+        'payment_amounts',
+        'payments_lock',
+    )
+
     def __init__(
         self,
         id: int,
@@ -111,15 +192,171 @@ class ParkingLot(BaseModel):
         super().__init__(id)
         self.name = name
         self.address = address
-        self.floors = floors
+        self.floors = []
         self.gates = gates
         self.allowed_vehicles = allowed_vehicles
         self.capacity = capacity
         self.status = status
         self.slot_assignment_strategy = slot_assignment_strategy
 
+        # kept up to date by Floor as slots are added / change status,
+        # so availability queries never walk floors x slots
+        self.total_slot_count = 0
+        self.total_by_type: Dict[VehicleType, int] = Counter()
+        self.available_by_type: Dict[VehicleType, int] = Counter()
+        # floors update these concurrently, += on a Counter is not atomic
+        self.counter_lock = threading.Lock()
+
+        # registration_number -> Ticket / Vehicle for vehicles currently inside.
+        # parked_vehicles also holds vehicles reserved while their ticket is
+        # being issued; both dicts are only changed under tickets_lock.
+        self.active_tickets: Dict[str, "Ticket"] = {}
+        self.parked_vehicles: Dict[str, "Vehicle"] = {}
+        self.tickets_lock = threading.Lock()
+
+        # fixed-width int64 column of successful payment amounts; revenue is
+        # summed from it instead of walking Payment objects
+        self.payment_amounts = array('q')
+        self.payments_lock = threading.Lock()
+
+        # floors ordered by floor_number, rebuilt only when a floor is added
+        self.sorted_floors: Tuple["Floor", ...] = ()
+        self.reversed_floors: Tuple["Floor", ...] = ()
+
+        for floor in floors:
+            self.add_floor(floor)
+
+    def add_floor(self, floor: "Floor"):
+        floor.finalize()
+        floor.parking_lot = self
+        self.floors.append(floor)
+        self.sorted_floors = tuple(sorted(self.floors, key=lambda f: f.floor_number))
+        self.reversed_floors = self.sorted_floors[::-1]
+        for slot in floor.slots:
+            self._count_slot(slot)
+
+    def _count_slot(self, slot: "Slot"):
+        with self.counter_lock:
+            self.total_slot_count += 1
+            self.total_by_type[slot.vehicle_type] += 1
+            if slot.status == SlotStatus.EMPTY:
+                self.available_by_type[slot.vehicle_type] += 1
+
+    def _adjust_available(self, vehicle_type: VehicleType, delta: int):
+        with self.counter_lock:
+            self.available_by_type[vehicle_type] += delta
+
+    def get_available_slots_count(self, vehicle_type: VehicleType) -> int:
+        # available_by_type always equals the number of EMPTY slots of each type
+        # across floors: bumped by add_floor / Floor.add_parking_slot, adjusted
+        # by Floor whenever a slot leaves or returns to EMPTY
+        return self.available_by_type.get(vehicle_type, 0)
+
+    def reserve_vehicle(self, vehicle: "Vehicle") -> bool:
+        # atomic duplicate check: only one caller can hold a registration number,
+        # so two gates can't both claim a slot for the same vehicle
+        with self.tickets_lock:
+            if vehicle.registration_number in self.parked_vehicles:
+                return False
+            self.parked_vehicles[vehicle.registration_number] = vehicle
+            return True
+
+    def release_vehicle(self, registration_number: str):
+        # rolls back reserve_vehicle when no ticket was issued
+        with self.tickets_lock:
+            if registration_number not in self.active_tickets:
+                self.parked_vehicles.pop(registration_number, None)
+
+    def park_vehicle(self, ticket: "Ticket"):
+        registration_number = ticket.vehicle.registration_number
+        with self.tickets_lock:
+            self.active_tickets[registration_number] = ticket
+            self.parked_vehicles[registration_number] = ticket.vehicle
+
+    def park_vehicles_batch(self, vehicles: List["Vehicle"], floor_number: int) -> List["Ticket"]:
+        # One slice of the floor's free list per vehicle type instead of a
+        # strategy lookup + claim per vehicle; vehicles that don't fit are skipped.
+        # Bookkeeping is in memory only: unlike TicketService.issueTicket the
+        # tickets have no gate or number and are not saved to a ticket repo.
+        floor = next((f for f in self.sorted_floors if f.floor_number == floor_number), None)
+        if floor is None:
+            return []
+        # reserve_vehicle also drops repeats within the batch ("ab 1" / "AB1")
+        by_type: Dict[VehicleType, List["Vehicle"]] = defaultdict(list)
+        for vehicle in vehicles:
+            if self.reserve_vehicle(vehicle):
+                by_type[vehicle.vehicle_type].append(vehicle)
+
+        entry_ts = time.time()
+        tickets = []
+        for vehicle_type, group in by_type.items():
+            slots = floor.claim_free_slots(vehicle_type, len(group))
+            for vehicle, slot in zip(group, slots):
+                ticket = Ticket(id=-1, number="", entry_ts=entry_ts, vehicle=vehicle, slot=slot,
+                                generated_gate=None)
+                self.park_vehicle(ticket)
+                tickets.append(ticket)
+            for vehicle in group[len(slots):]:
+                self.release_vehicle(vehicle.registration_number)
+        return tickets
+
+    def unpark_vehicle(self, registration_number: str) -> "Ticket":
+        # park side is keyed by Vehicle.registration_number, already normalized
+        registration_number = normalize_registration(registration_number)
+        with self.tickets_lock:
+            ticket = self.active_tickets.pop(registration_number, None)
+            if ticket is None:
+                return None
+            del self.parked_vehicles[registration_number]
+        ticket.slot.floor.update_slot_status(ticket.slot, SlotStatus.EMPTY)
+        return ticket
+
+    def record_payment(self, payment: "Payment"):
+        # amounts are kept in a signed 64-bit array; reject anything outside
+        # 0..2**63-1 with a ValueError rather than array's OverflowError
+        if payment.status != PaymentStatus.SUCCESS:
+            return
+        if not 0 <= payment.amount <= PAYMENT_AMOUNT_MAX:
+            raise ValueError(f"payment amount out of range: {payment.amount}")
+        with self.payments_lock:
+            self.payment_amounts.append(payment.amount)
+
+    @property
+    def total_revenue(self) -> int:
+        # one C-level pass over the int64 column; the total itself may exceed int64
+        with self.payments_lock:
+            return sum(self.payment_amounts)
+
+    def display_lot_status(self):
+        # build the whole report and write it once instead of a print per slot
+        lines = [f"\n--- {self.name} Status ---"]
+        for floor in self.sorted_floors:
+            lines.append(f"Floor {floor.floor_number} ({floor.status.name}):")
+            for slot in floor.slots:
+                lines.append(
+                    f"  Slot {slot.slot_number} [{slot.vehicle_type.name}] {slot.status.name}"
+                )
+        lines.append("Available: " + ", ".join(
+            f"{vehicle_type.name}={self.available_by_type[vehicle_type]}/{total}"
+            for vehicle_type, total in self.total_by_type.items()
+        ))
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 class Floor(BaseModel):
+    __slots__ = (
+        'floor_number',
+        'slots',
+        'status',
+        'allowed_vehicles',
+        'parking_lot',
+        'slot_by_number',
+        'free_slots_by_type',
+        'free_zorder_by_type',
+        'slot_counts',
+        'lock',
+    )
+
     def __init__(
         self,
         id: int,
@@ -130,12 +367,171 @@ class Floor(BaseModel):
     ):
         super().__init__(id)
         self.floor_number = floor_number
-        self.slots = slots
+        # appended to during setup, frozen into a tuple by finalize()
+        self.slots: List["Slot"] = []
         self.status = status
         self.allowed_vehicles = allowed_vehicles
+        self.parking_lot = None
+        # guards this floor's index only, so gates parking on different
+        # floors don't wait on each other
+        self.lock = threading.Lock()
+
+        # slot_number -> Slot, and sorted free slot_numbers per vehicle type,
+        # so strategies never have to scan self.slots to find an empty one.
+        self.slot_by_number: Dict[int, "Slot"] = {}
+        self.free_slots_by_type: Dict[VehicleType, List[int]] = defaultdict(list)
+        # the same free slots as (zorder(x, y), slot_number), for gate-distance lookups
+        self.free_zorder_by_type: Dict[VehicleType, List[Tuple[int, int]]] = defaultdict(list)
+        # (vehicle_type, status) -> number of slots, for statistics
+        self.slot_counts: Dict[Tuple[VehicleType, SlotStatus], int] = Counter()
+
+        for slot in slots:
+            self.add_parking_slot(slot)
+
+    def add_parking_slot(self, slot: "Slot"):
+        # computed first: a bad coordinate must fail before any index changes
+        zorder_key = _zorder_key(slot)
+        with self.lock:
+            if isinstance(self.slots, tuple):
+                raise ValueError(
+                    f"floor {self.floor_number} is finalized; add slots before ParkingLot.add_floor"
+                )
+            self.slots.append(slot)
+            self.slot_by_number[slot.slot_number] = slot
+            self.slot_counts[(slot.vehicle_type, slot.status)] += 1
+            if slot.status == SlotStatus.EMPTY:
+                insort(self.free_slots_by_type[slot.vehicle_type], slot.slot_number)
+                insort(self.free_zorder_by_type[slot.vehicle_type], zorder_key)
+
+    def finalize(self):
+        # Freeze slots into a tuple ordered by slot_number once setup is done
+        # (ParkingLot.add_floor calls this): scans such as statistics and
+        # display walk the tuple, point lookups go through slot_by_number.
+        with self.lock:
+            if not isinstance(self.slots, tuple):
+                self.slots = tuple(sorted(self.slots, key=lambda s: s.slot_number))
+
+    def get_available_slots_count(self, vehicle_type: VehicleType) -> int:
+        return self.slot_counts.get((vehicle_type, SlotStatus.EMPTY), 0)
+
+    # peeks are taken under the floor lock so a concurrent claim can't empty
+    # the list between the check and the index
+
+    def nearest_free_slot(self, vehicle_type: VehicleType, x: int, y: int) -> "Slot":
+        # Walk outward from (x, y)'s position in the z-ordered free list. Once a
+        # candidate at distance d is known, only codes between the corners of
+        # the box of half-width d around (x, y) can beat it, so each side stops
+        # as soon as it leaves that range. There is no jumping over the parts
+        # of that range outside the box, so a badly placed query can still walk
+        # most of the list; a slot at distance 0 ends the walk immediately.
+        z = zorder(x, y)
+        with self.lock:
+            free = self.free_zorder_by_type.get(vehicle_type)
+            if not free:
+                return None
+            right = bisect_left(free, (z, -1))
+            # entries are ordered by (z, slot_number) and z is unique per
+            # (x, y): a hit here is the lowest-numbered slot at distance 0
+            if right < len(free) and free[right][0] == z:
+                return self.slot_by_number[free[right][1]]
+            left = right - 1
+            right = left + 1
+            z_low, z_high = 0, math.inf
+            best, best_key = None, None
+            while True:
+                go_left = left >= 0 and free[left][0] >= z_low
+                go_right = right < len(free) and free[right][0] <= z_high
+                if not (go_left or go_right):
+                    return best
+                candidates = []
+                if go_left:
+                    candidates.append(free[left][1])
+                    left -= 1
+                if go_right:
+                    candidates.append(free[right][1])
+                    right += 1
+                for slot_number in candidates:
+                    slot = self.slot_by_number[slot_number]
+                    key = ((slot.x - x) ** 2 + (slot.y - y) ** 2, slot_number)
+                    if best_key is None or key < best_key:
+                        best, best_key = slot, key
+                        r = math.isqrt(key[0])
+                        if r * r < key[0]:
+                            r += 1
+                        z_low = zorder(max(x - r, 0), max(y - r, 0))
+                        z_high = zorder(min(x + r, ZORDER_MAX), min(y + r, ZORDER_MAX))
+
+    def farthest_free_slot(self, vehicle_type: VehicleType) -> "Slot":
+        with self.lock:
+            free = self.free_slots_by_type.get(vehicle_type)
+            return self.slot_by_number[free[-1]] if free else None
+
+    def random_free_slot(self, vehicle_type: VehicleType) -> "Slot":
+        with self.lock:
+            free = self.free_slots_by_type.get(vehicle_type)
+            return self.slot_by_number[random.choice(free)] if free else None
+
+    def update_slot_status(self, slot: "Slot", status: SlotStatus):
+        with self.lock:
+            self._set_slot_status(slot, status)
+
+    def claim_slot(self, slot: "Slot") -> bool:
+        # strategies pick a slot without locking; only one caller may fill it
+        with self.lock:
+            if slot.status != SlotStatus.EMPTY:
+                return False
+            self._set_slot_status(slot, SlotStatus.FILLED)
+            return True
+
+    def claim_free_slots(self, vehicle_type: VehicleType, count: int) -> List["Slot"]:
+        # fills up to `count` of the lowest-numbered free slots in one go
+        with self.lock:
+            free = self.free_slots_by_type.get(vehicle_type)
+            if not free or count <= 0:
+                return []
+            taken = free[:count]
+            del free[:count]
+            taken_set = set(taken)
+            free_zorder = self.free_zorder_by_type[vehicle_type]
+            free_zorder[:] = [key for key in free_zorder if key[1] not in taken_set]
+
+            slots = [self.slot_by_number[slot_number] for slot_number in taken]
+            now = time.time()
+            for slot in slots:
+                slot.status = SlotStatus.FILLED
+                slot.touch(now)
+            self.slot_counts[(vehicle_type, SlotStatus.EMPTY)] -= len(slots)
+            self.slot_counts[(vehicle_type, SlotStatus.FILLED)] += len(slots)
+        if self.parking_lot is not None:
+            self.parking_lot._adjust_available(vehicle_type, -len(slots))
+        return slots
+
+    def _set_slot_status(self, slot: "Slot", status: SlotStatus):
+        if slot.status == status:
+            return
+        zorder_key = _zorder_key(slot)
+        free = self.free_slots_by_type[slot.vehicle_type]
+        free_zorder = self.free_zorder_by_type[slot.vehicle_type]
+        delta = 0
+        if slot.status == SlotStatus.EMPTY:
+            del free[bisect_left(free, slot.slot_number)]
+            del free_zorder[bisect_left(free_zorder, zorder_key)]
+            delta = -1
+        elif status == SlotStatus.EMPTY:
+            insort(free, slot.slot_number)
+            insort(free_zorder, zorder_key)
+            delta = 1
+        self.slot_counts[(slot.vehicle_type, slot.status)] -= 1
+        self.slot_counts[(slot.vehicle_type, status)] += 1
+        slot.status = status
+        slot.touch()
+        if delta and self.parking_lot is not None:
+            self.parking_lot._adjust_available(slot.vehicle_type, delta)
 
 
 class Slot(BaseModel):
+    __slots__ = ('slot_number', 'vehicle_type', 'status', 'floor', 'x', 'y')
+
     def __init__(
         self,
         id: int,
@@ -143,15 +539,26 @@ class Slot(BaseModel):
         vehicle_type: VehicleType,
         status: SlotStatus,
         floor: "Floor",
+        x: int = 0,
+        y: int = 0,
     ):
+        check_coordinates(x, y)
         super().__init__(id)
         self.slot_number = slot_number
         self.vehicle_type = vehicle_type
         self.status = status
         self.floor = floor
+        self.x = x
+        self.y = y
+
+
+def _zorder_key(slot: Slot) -> Tuple[int, int]:
+    return zorder(slot.x, slot.y), slot.slot_number
 
 
 class Gate(BaseModel):
+    __slots__ = ('gate_number', 'gate_type', 'parking_lot', 'status', 'x', 'y')
+
     def __init__(
         self,
         id: int,
@@ -159,53 +566,78 @@ class Gate(BaseModel):
         gate_type: GateType,
         parking_lot: ParkingLot,
         status: GateStatus,
+        x: int = 0,
+        y: int = 0,
     ):
+        check_coordinates(x, y)
         super().__init__(id)
         self.gate_number = gate_number
         self.gate_type = gate_type
         self.parking_lot = parking_lot
         self.status = status
+        self.x = x
+        self.y = y
 
 
 # ============================================================
 # Vehicle & Ticket Models
 # ============================================================
 
+def normalize_registration(registration_number: str) -> str:
+    # "dl 01 ab 1234" -> "DL01AB1234"; done once where a number enters the
+    # system so every dict keyed on it can compare raw strings
+    return registration_number.upper().replace(" ", "")
+
+
 class Vehicle(BaseModel):
+    __slots__ = ('registration_number', 'owner_name', 'vehicle_type')
+
     def __init__(
         self,
         id: int,
+        registration_number: str,
         owner_name: str,
         vehicle_type: VehicleType,
     ):
         super().__init__(id)
+        self.registration_number = normalize_registration(registration_number)
         self.owner_name = owner_name
         self.vehicle_type = vehicle_type
 
 
 class Ticket(BaseModel):
+    __slots__ = ('number', 'entry_ts', 'vehicle', 'slot', 'generated_gate')
+
     def __init__(
         self,
         id: int,
         number: str,
-        entry_time: datetime,
+        entry_ts: Optional[float],
         vehicle: Vehicle,
         slot: Slot,
         generated_gate: Gate,
     ):
-        super().__init__(id)
+        if entry_ts is None:
+            entry_ts = time.time()
+        super().__init__(id, entry_ts)
         self.number = number
-        self.entry_time = entry_time
+        self.entry_ts = entry_ts
         self.vehicle = vehicle
         self.slot = slot
         self.generated_gate = generated_gate
 
+    @property
+    def entry_time(self) -> datetime:
+        return datetime.fromtimestamp(self.entry_ts)
+
 
 # ============================================================
 # Billing & Payment Models
 # ============================================================
 
 class Bill(BaseModel):
+    __slots__ = ('exit_time', 'ticket', 'total_amount', 'status', 'payments')
+
     def __init__(
         self,
         id: int,
@@ -224,6 +656,8 @@ class Bill(BaseModel):
 
 
 class Payment(BaseModel):
+    __slots__ = ('amount', 'mode', 'ref_id', 'bill', 'status', 'paid_at')
+
     def __init__(
         self,
         id: int,
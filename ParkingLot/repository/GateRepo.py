@@ -0,0 +1,15 @@
+from typing import Dict
+
+from models.models import Gate
+
+
+class GateRepo:
+    def __init__(self):
+        self._by_id: Dict[int, Gate] = {}
+
+    def find_gate_by_id(self, gate_id: int) -> Gate:
+        return self._by_id.get(gate_id)
+
+    def save_gate(self, gate: Gate) -> Gate:
+        self._by_id[gate.id] = gate
+        return gate
@@ -0,0 +1,13 @@
+from models.models import ParkingLot, ParkingLotStatus
+
+
+class ParkingLotRepo:
+    def update_parking_lot_count(self, parking_lot: ParkingLot) -> ParkingLot:
+        # availability itself is kept by the lot's counters; only the
+        # OPEN <-> FULL status is derived here
+        available = sum(parking_lot.available_by_type.values())
+        if available == 0 and parking_lot.status == ParkingLotStatus.OPEN:
+            parking_lot.status = ParkingLotStatus.FULL
+        elif available > 0 and parking_lot.status == ParkingLotStatus.FULL:
+            parking_lot.status = ParkingLotStatus.OPEN
+        return parking_lot
@@ -0,0 +1,11 @@
+from models.models import Slot, SlotStatus
+
+
+class SlotRepo:
+    def update_slot_status(self, slot: Slot, status: SlotStatus) -> Slot:
+        # goes through the floor so its free-slot index stays in sync
+        slot.floor.update_slot_status(slot, status)
+        return slot
+
+    def claim_slot(self, slot: Slot) -> bool:
+        return slot.floor.claim_slot(slot)
@@ -0,0 +1,23 @@
+import itertools
+import threading
+from typing import Dict
+
+from models.models import Ticket
+
+
+class TicketRepo:
+    def __init__(self):
+        self._by_id: Dict[int, Ticket] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def save_ticket(self, ticket: Ticket) -> Ticket:
+        with self._lock:
+            if ticket.id == -1:
+                ticket.id = next(self._ids)
+                ticket.number = f"T{ticket.id:05d}"
+            self._by_id[ticket.id] = ticket
+        return ticket
+
+    def find_ticket_by_id(self, ticket_id: int) -> Ticket:
+        return self._by_id.get(ticket_id)
@@ -0,0 +1,16 @@
+from typing import Dict
+
+from models.models import Vehicle
+
+
+class VehicleRepo:
+    def __init__(self):
+        # keyed by the already-normalized registration number
+        self._by_reg: Dict[str, Vehicle] = {}
+
+    def find_vehicle_by_number(self, vehicle_number: str) -> Vehicle:
+        return self._by_reg.get(vehicle_number)
+
+    def save_vehicle(self, vehicle: Vehicle) -> Vehicle:
+        self._by_reg[vehicle.registration_number] = vehicle
+        return vehicle
@@ -0,0 +1 @@
+"""In-memory repositories for the Parking Lot Management System"""
@@ -1,11 +1,12 @@
 
-import datetime
+import time
 
-from models.models import Ticket, Vehicle, SlotStatus
+from models.models import Ticket, Vehicle, SlotStatus, normalize_registration
 
 from strgy import *
 
-from strgy.getSlotFactory import SlotFactory
+from strgy.FeeCalculator import compute_fee
+from strgy.getSlotFactory import SLOT_GETTERS
 
 
 class TicketService:
@@ -18,8 +19,10 @@ class TicketService:
         self.ticketRepo = ticketRepo
 
     def issueTicket(self, vehicle_number, owner_name, gate_id, vehicleType) -> Ticket:
+        vehicle_number = normalize_registration(vehicle_number)
+
         # create a ticket..
-        ticket = Ticket(id=-1, number="", entry_time=datetime.datetime.now(), vehicle=None, parking_slot=None,
+        ticket = Ticket(id=-1, number="", entry_ts=time.time(), vehicle=None, slot=None,
                         generated_gate=None)
         #  set info.. like gate no...
         gate = self.gateRepo.find_gate_by_id(gate_id)
@@ -30,27 +33,67 @@ class TicketService:
         # Vehicle info..
         vehicle = self.vehicleRepo.find_vehicle_by_number(vehicle_number)
         if vehicle is None:
-            vehicle = Vehicle(id=vehicle_number, owner_name=owner_name, vehicle_type=vehicleType)
+            vehicle = Vehicle(id=vehicle_number, registration_number=vehicle_number, owner_name=owner_name,
+                              vehicle_type=vehicleType)
             vehicle = self.vehicleRepo.save_vehicle(vehicle)
         ticket.vehicle = vehicle
 
-        # find a slot..
-        slotStgy = SlotFactory.get_slot_stgy_obj(gate.parking_lot.slot_assignment_strategy)
+        # reserve the vehicle before claiming a slot.. a second gate issuing
+        # for the same vehicle fails here instead of taking another slot
+        parking_lot = gate.parking_lot
+        if not parking_lot.reserve_vehicle(vehicle):
+            raise Exception("Vehicle already parked")
 
-        if not slotStgy:
-            raise Exception("Slot stgy not found")
+        slot = None
+        try:
+            # find a slot..
+            get_slot = SLOT_GETTERS.get(parking_lot.slot_assignment_strategy)
 
-        slot = slotStgy.get_slot(vehicle.vehicle_type, gate)
-        if not slot:
-            raise Exception("Slot not found")
+            if not get_slot:
+                raise Exception("Slot stgy not found")
 
-        ticket.parking_slot = slot
+            #  claim slot.. another gate may take the same slot first, then pick again
+            while True:
+                candidate = get_slot(vehicle.vehicle_type, gate)
+                if not candidate:
+                    raise Exception("Slot not found")
+                if self.slotRepo.claim_slot(candidate):
+                    slot = candidate
+                    break
 
-        #  update slot..
-        self.slotRepo.update_slot_status(slot, SlotStatus.FILLED)
+            ticket.slot = slot
 
-        # update parking counters..
-        self.parkingLotRepo.update_parking_lot_count(gate.parking_lot)
+            # update parking counters..
+            self.parkingLotRepo.update_parking_lot_count(parking_lot)
+
+            ticket = self.ticketRepo.save_ticket(ticket)
+        except Exception:
+            # roll back.. free the slot and the reservation
+            if slot is not None:
+                self.slotRepo.update_slot_status(slot, SlotStatus.EMPTY)
+            parking_lot.release_vehicle(vehicle.registration_number)
+            raise
+
+        # track active ticket against the vehicle..
+        parking_lot.park_vehicle(ticket)
 
         # return ticket..
-        return self.ticketRepo.save_ticket(ticket)
+        return ticket
+
+    def closeTicket(self, vehicle_number, gate_id) -> int:
+        vehicle_number = normalize_registration(vehicle_number)
+
+        gate = self.gateRepo.find_gate_by_id(gate_id)
+        if gate == None:
+            raise Exception("Gate not found")
+
+        # free the slot and drop the active ticket..
+        ticket = gate.parking_lot.unpark_vehicle(vehicle_number)
+        if ticket is None:
+            raise Exception("Vehicle not parked")
+
+        # update parking counters.. a FULL lot reopens here
+        self.parkingLotRepo.update_parking_lot_count(gate.parking_lot)
+
+        # fee..
+        return compute_fee(ticket, time.time())
@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from models.models import Ticket, VehicleType
+
+# ₹10 + ₹10 per full hour parked (see README)
+BASE_FEE = 10
+HOURLY_RATE = {
+    VehicleType.BIKE: 10,
+    VehicleType.CAR: 10,
+    VehicleType.BUS: 10,
+    VehicleType.TRUCK: 10,
+}
+
+
+# tariffs are fixed, so the fee only depends on (vehicle type, minutes parked)
+@lru_cache(maxsize=4096)
+def _compute_fee(vehicle_type: int, minutes: int) -> int:
+    return BASE_FEE + (minutes // 60) * HOURLY_RATE[VehicleType(vehicle_type)]
+
+
+def compute_fee(ticket: Ticket, exit_ts: float) -> int:
+    # clamped: an exit stamped before entry (clock step / skew) still pays BASE_FEE
+    minutes = max(0, int((exit_ts - ticket.entry_ts) // 60))
+    return _compute_fee(int(ticket.vehicle.vehicle_type), minutes)
@@ -0,0 +1,14 @@
+from models.models import Gate, Slot, VehicleType
+
+from .SlotStgyAbc import SlotStgyAbc
+
+
+class NearestSlotStrategy(SlotStgyAbc):
+    # closest free slot to the gate on the first floor that has one;
+    # ties (e.g. slots without coordinates) go to the lowest slot number
+    def get_slot(self, vehicle_type: VehicleType, gate: Gate) -> Slot:
+        for floor in gate.parking_lot.sorted_floors:
+            slot = floor.nearest_free_slot(vehicle_type, gate.x, gate.y)
+            if slot:
+                return slot
+        return None
@@ -0,0 +1,13 @@
+from models.models import Gate, Slot, VehicleType
+
+from .SlotStgyAbc import SlotStgyAbc
+
+
+class OptimizedSlotStrategy(SlotStgyAbc):
+    # prefers slots away from the entrance: top floor first, highest free slot number
+    def get_slot(self, vehicle_type: VehicleType, gate: Gate) -> Slot:
+        for floor in gate.parking_lot.reversed_floors:
+            slot = floor.farthest_free_slot(vehicle_type)
+            if slot:
+                return slot
+        return None
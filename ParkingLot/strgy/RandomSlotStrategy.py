@@ -0,0 +1,12 @@
+from models.models import Gate, Slot, VehicleType
+
+from .SlotStgyAbc import SlotStgyAbc
+
+
+class RandomSlotStrategy(SlotStgyAbc):
+    def get_slot(self, vehicle_type: VehicleType, gate: Gate) -> Slot:
+        for floor in gate.parking_lot.sorted_floors:
+            slot = floor.random_free_slot(vehicle_type)
+            if slot:
+                return slot
+        return None
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from models.models import Gate, Slot, VehicleType
+
+
+class SlotStgyAbc(ABC):
+
+    @abstractmethod
+    def get_slot(self, vehicle_type: VehicleType, gate: Gate) -> Slot:
+        pass
@@ -0,0 +1 @@
+"""Slot assignment strategies for the Parking Lot Management System"""
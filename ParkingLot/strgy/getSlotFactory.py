@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Callable, Dict
+
+from models.models import Gate, Slot, SlotAssignmentStrategy, VehicleType
+
+from strgy.NearestSlotStrategy import NearestSlotStrategy
+from strgy.OptimizedSlotStrategy import OptimizedSlotStrategy
+from strgy.RandomSlotStrategy import RandomSlotStrategy
+
+
+class SlotFactory:
+    # strategies are stateless, so one shared instance per enum value is enough
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_slot_stgy_obj(slot_assignment_strategy):
+        if slot_assignment_strategy == SlotAssignmentStrategy.RANDOM:
+            return RandomSlotStrategy()
+        if slot_assignment_strategy == SlotAssignmentStrategy.NEAREST:
+            return NearestSlotStrategy()
+        if slot_assignment_strategy == SlotAssignmentStrategy.OPTIMIZED:
+            return OptimizedSlotStrategy()
+
+
+# enum -> bound get_slot of the shared strategy instance, so the ticket
+# path does one dict lookup and a direct call instead of factory + method lookup
+SLOT_GETTERS: Dict[SlotAssignmentStrategy, Callable[[VehicleType, Gate], Slot]] = {
+    strategy: SlotFactory.get_slot_stgy_obj(strategy).get_slot
+    for strategy in SlotAssignmentStrategy
+}
@@ -0,0 +1,4 @@
+"""Tests for the Parking Lot Management System
+
+Run from the ParkingLot directory: python -m unittest
+"""
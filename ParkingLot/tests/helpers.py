@@ -0,0 +1,30 @@
+from models.models import (
+    Floor, FloorStatus, Gate, GateStatus, GateType, ParkingLot, ParkingLotStatus,
+    Slot, SlotAssignmentStrategy, SlotStatus, VehicleType,
+)
+
+
+def make_floor(floor_number, slot_types, coords=None):
+    floor = Floor(floor_number, floor_number, [], FloorStatus.OPEN, list(VehicleType))
+    for i, vehicle_type in enumerate(slot_types, start=1):
+        x, y = coords[i - 1] if coords else (0, 0)
+        floor.add_parking_slot(Slot(i, i, vehicle_type, SlotStatus.EMPTY, floor, x, y))
+    return floor
+
+
+def make_lot(floors, strategy=SlotAssignmentStrategy.NEAREST):
+    lot = ParkingLot(1, "Test Lot", "Test Address", floors, [], list(VehicleType),
+                     sum(len(f.slots) for f in floors), ParkingLotStatus.OPEN, strategy)
+    gate = Gate(1, 1, GateType.ENTRY, lot, GateStatus.OPEN)
+    lot.gates.append(gate)
+    return lot, gate
+
+
+def scan_available(lot, vehicle_type):
+    # ground truth for the maintained counters
+    return sum(
+        1
+        for floor in lot.floors
+        for slot in floor.slots
+        if slot.vehicle_type == vehicle_type and slot.status == SlotStatus.EMPTY
+    )
@@ -0,0 +1,51 @@
+import unittest
+
+from models.models import SlotStatus, Vehicle, VehicleType
+
+from tests.helpers import make_floor, make_lot, scan_available
+
+
+class ParkVehiclesBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.lot, _ = make_lot([make_floor(1, [VehicleType.CAR] * 3 + [VehicleType.BIKE] * 2)])
+
+    def test_parks_lowest_free_slots_per_type(self):
+        vehicles = [
+            Vehicle(1, "C1", "owner", VehicleType.CAR),
+            Vehicle(2, "B1", "owner", VehicleType.BIKE),
+            Vehicle(3, "C2", "owner", VehicleType.CAR),
+        ]
+        tickets = self.lot.park_vehicles_batch(vehicles, floor_number=1)
+        self.assertEqual(
+            {t.vehicle.registration_number: t.slot.slot_number for t in tickets},
+            {"C1": 1, "C2": 2, "B1": 4},
+        )
+        self.assertEqual(self.lot.get_available_slots_count(VehicleType.CAR), 1)
+
+    def test_duplicate_registration_in_batch_takes_one_slot(self):
+        vehicles = [
+            Vehicle(1, "ab 1", "owner", VehicleType.CAR),
+            Vehicle(2, "AB1", "owner", VehicleType.CAR),
+        ]
+        tickets = self.lot.park_vehicles_batch(vehicles, floor_number=1)
+        self.assertEqual(len(tickets), 1)
+
+        self.assertIs(self.lot.unpark_vehicle("ab 1"), tickets[0])
+        self.assertTrue(all(s.status == SlotStatus.EMPTY for s in self.lot.floors[0].slots))
+        self.assertEqual(self.lot.get_available_slots_count(VehicleType.CAR), 3)
+
+    def test_vehicles_without_a_slot_are_not_left_reserved(self):
+        vehicles = [Vehicle(i, f"C{i}", "owner", VehicleType.CAR) for i in range(5)]
+        tickets = self.lot.park_vehicles_batch(vehicles, floor_number=1)
+        self.assertEqual(len(tickets), 3)
+        self.assertEqual(set(self.lot.parked_vehicles), {"C0", "C1", "C2"})
+        self.assertEqual(scan_available(self.lot, VehicleType.CAR), 0)
+
+    def test_already_parked_vehicle_is_skipped(self):
+        vehicle = Vehicle(1, "C1", "owner", VehicleType.CAR)
+        self.lot.park_vehicles_batch([vehicle], floor_number=1)
+        self.assertEqual(self.lot.park_vehicles_batch([vehicle], floor_number=1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import unittest
+from collections import Counter
+
+from models.models import SlotStatus, Vehicle, VehicleType, zorder
+
+from tests.helpers import make_floor, make_lot, scan_available
+
+
+class AvailabilityInvariantTest(unittest.TestCase):
+    """Every maintained counter / index must agree with a full scan of the slots."""
+
+    def assert_consistent(self, lot):
+        for vehicle_type in VehicleType:
+            self.assertEqual(lot.get_available_slots_count(vehicle_type),
+                             scan_available(lot, vehicle_type), vehicle_type)
+        for floor in lot.floors:
+            scanned = Counter((s.vehicle_type, s.status) for s in floor.slots)
+            self.assertEqual(+floor.slot_counts, scanned)
+            for vehicle_type in VehicleType:
+                free = [s for s in floor.slots
+                        if s.vehicle_type == vehicle_type and s.status == SlotStatus.EMPTY]
+                self.assertEqual(floor.free_slots_by_type.get(vehicle_type, []),
+                                 [s.slot_number for s in free])
+                self.assertEqual(floor.free_zorder_by_type.get(vehicle_type, []),
+                                 sorted((zorder(s.x, s.y), s.slot_number) for s in free))
+                self.assertEqual(floor.get_available_slots_count(vehicle_type), len(free))
+
+    def test_counters_match_full_scan_after_random_operations(self):
+        rng = random.Random(3)
+        types = [VehicleType.CAR, VehicleType.BIKE, VehicleType.TRUCK]
+        floors = [
+            make_floor(n, [rng.choice(types) for _ in range(30)],
+                       [(rng.randint(0, 40), rng.randint(0, 40)) for _ in range(30)])
+            for n in (2, 1, 3)
+        ]
+        lot, _ = make_lot(floors)
+        self.assert_consistent(lot)
+
+        next_id = 0
+        for _ in range(300):
+            op = rng.random()
+            if op < 0.3:
+                batch = []
+                for _ in range(rng.randint(1, 5)):
+                    next_id += 1
+                    batch.append(Vehicle(next_id, f"V{next_id}", "owner", rng.choice(types)))
+                lot.park_vehicles_batch(batch, floor_number=rng.randint(1, 3))
+            elif op < 0.6 and lot.active_tickets:
+                lot.unpark_vehicle(rng.choice(list(lot.active_tickets)))
+            else:
+                floor = rng.choice(lot.floors)
+                slot = rng.choice(floor.slots)
+                if slot.status != SlotStatus.FILLED:
+                    status = rng.choice([SlotStatus.EMPTY, SlotStatus.RESERVED, SlotStatus.BLOCKED])
+                    floor.update_slot_status(slot, status)
+            self.assert_consistent(lot)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import time
+import unittest
+from datetime import datetime
+
+from models.models import (
+    PAYMENT_AMOUNT_MAX, Payment, PaymentMode, PaymentStatus, Slot, SlotStatus, VehicleType,
+)
+
+from tests.helpers import make_floor, make_lot
+
+
+class TimestampTest(unittest.TestCase):
+    def test_updated_at_is_settable(self):
+        slot = make_floor(1, [VehicleType.CAR]).slots[0]
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        slot.updated_at = when
+        self.assertEqual(slot.updated_at, when)
+
+    def test_status_change_touches_slot(self):
+        floor = make_floor(1, [VehicleType.CAR])
+        slot = floor.slots[0]
+        stale = time.time() - 60
+        slot.touch(stale)
+        floor.update_slot_status(slot, SlotStatus.FILLED)
+        self.assertGreater(slot.updated_at.timestamp(), stale)
+
+
+class FloorSlotsTest(unittest.TestCase):
+    def test_add_floor_freezes_slots_by_slot_number(self):
+        floor = make_floor(1, [VehicleType.CAR] * 3)
+        for slot_number in (10, 5, 11):
+            floor.add_parking_slot(Slot(slot_number, slot_number, VehicleType.CAR, SlotStatus.EMPTY, floor))
+        make_lot([floor])
+        self.assertIsInstance(floor.slots, tuple)
+        self.assertEqual([s.slot_number for s in floor.slots], [1, 2, 3, 5, 10, 11])
+
+    def test_finalized_floor_rejects_new_slots(self):
+        floor = make_floor(1, [VehicleType.CAR])
+        lot, _ = make_lot([floor])
+        with self.assertRaises(ValueError):
+            floor.add_parking_slot(Slot(2, 2, VehicleType.CAR, SlotStatus.EMPTY, floor))
+        self.assertEqual(len(floor.slots), 1)
+        self.assertEqual(lot.get_available_slots_count(VehicleType.CAR), 1)
+
+
+def _payment(amount, status=PaymentStatus.SUCCESS):
+    return Payment(1, amount, PaymentMode.CASH, "ref", None, status, datetime.now())
+
+
+class RecordPaymentTest(unittest.TestCase):
+    def setUp(self):
+        self.lot, _ = make_lot([make_floor(1, [VehicleType.CAR])])
+
+    def test_only_successful_payments_count(self):
+        self.lot.record_payment(_payment(40))
+        self.lot.record_payment(_payment(25, PaymentStatus.FAILED))
+        self.assertEqual(list(self.lot.payment_amounts), [40])
+        self.assertEqual(self.lot.total_revenue, 40)
+
+    def test_out_of_range_amount_is_rejected(self):
+        self.lot.record_payment(_payment(PAYMENT_AMOUNT_MAX))
+        for amount in (PAYMENT_AMOUNT_MAX + 1, -1):
+            with self.assertRaises(ValueError):
+                self.lot.record_payment(_payment(amount))
+        self.assertEqual(list(self.lot.payment_amounts), [PAYMENT_AMOUNT_MAX])
+        self.assertEqual(self.lot.total_revenue, PAYMENT_AMOUNT_MAX)
+
+    def test_revenue_is_summed_past_int64(self):
+        self.lot.record_payment(_payment(PAYMENT_AMOUNT_MAX))
+        self.lot.record_payment(_payment(PAYMENT_AMOUNT_MAX))
+        self.assertEqual(self.lot.total_revenue, 2 * PAYMENT_AMOUNT_MAX)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from models.models import (
+    Gate, GateStatus, GateType, Slot, SlotStatus, VehicleType, ZORDER_MAX, zorder,
+)
+
+from tests.helpers import make_floor, make_lot, scan_available
+
+
+def brute_force_nearest(floor, x, y):
+    free = [s for s in floor.slots if s.status == SlotStatus.EMPTY]
+    if not free:
+        return None
+    return min(free, key=lambda s: ((s.x - x) ** 2 + (s.y - y) ** 2, s.slot_number))
+
+
+class ZOrderTest(unittest.TestCase):
+    def test_rejects_out_of_range_coordinates(self):
+        for x, y in ((-1, 0), (0, -1), (ZORDER_MAX + 1, 0), (0, ZORDER_MAX + 1)):
+            with self.assertRaises(ValueError):
+                zorder(x, y)
+
+    def test_corners_are_distinct(self):
+        codes = {zorder(x, y) for x in (0, ZORDER_MAX) for y in (0, ZORDER_MAX)}
+        self.assertEqual(len(codes), 4)
+
+    def test_models_reject_out_of_range_coordinates(self):
+        floor = make_floor(1, [VehicleType.CAR])
+        with self.assertRaises(ValueError):
+            Slot(2, 2, VehicleType.CAR, SlotStatus.EMPTY, floor, -5, 0)
+        with self.assertRaises(ValueError):
+            Gate(1, 1, GateType.ENTRY, None, GateStatus.OPEN, 0, ZORDER_MAX + 1)
+
+    def test_bad_slot_leaves_floor_unchanged(self):
+        floor = make_floor(1, [VehicleType.CAR])
+        slot = Slot(2, 2, VehicleType.CAR, SlotStatus.EMPTY, floor)
+        slot.x = -5
+        with self.assertRaises(ValueError):
+            floor.add_parking_slot(slot)
+        lot, _ = make_lot([floor])
+        self.assertEqual([s.slot_number for s in floor.slots], [1])
+        self.assertNotIn(2, floor.slot_by_number)
+        self.assertEqual(floor.get_available_slots_count(VehicleType.CAR), 1)
+        self.assertEqual(scan_available(lot, VehicleType.CAR), 1)
+        self.assertEqual(lot.get_available_slots_count(VehicleType.CAR), 1)
+
+
+class NearestFreeSlotTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            n = rng.randint(1, 60)
+            span = rng.choice([3, 50, 1000, ZORDER_MAX])
+            coords = [(rng.randint(0, span), rng.randint(0, span)) for _ in range(n)]
+            floor = make_floor(1, [VehicleType.CAR] * n, coords)
+            for slot_number in rng.sample(range(1, n + 1), n // 3):
+                floor.update_slot_status(floor.slot_by_number[slot_number], SlotStatus.FILLED)
+            for _ in range(10):
+                x, y = rng.randint(0, span), rng.randint(0, span)
+                self.assertIs(floor.nearest_free_slot(VehicleType.CAR, x, y),
+                              brute_force_nearest(floor, x, y))
+
+    def test_without_coordinates_returns_lowest_free_slot(self):
+        floor = make_floor(1, [VehicleType.CAR] * 1000)
+        for slot_number in (1, 2, 5):
+            floor.update_slot_status(floor.slot_by_number[slot_number], SlotStatus.FILLED)
+        self.assertEqual(floor.nearest_free_slot(VehicleType.CAR, 0, 0).slot_number, 3)
+
+    def test_no_free_slot(self):
+        floor = make_floor(1, [VehicleType.BIKE])
+        self.assertIsNone(floor.nearest_free_slot(VehicleType.CAR, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import unittest
+
+from models.models import ParkingLotStatus, SlotStatus, VehicleType
+from repository.ParkingLotRepo import ParkingLotRepo
+from repository.SlotRepo import SlotRepo
+from repository.VehicleRepo import VehicleRepo
+from service.TicketService import TicketService
+from strgy.FeeCalculator import BASE_FEE, compute_fee
+
+from tests.helpers import make_floor, make_lot, scan_available
+
+
+class _StubRepo:
+    def __init__(self, gate):
+        self.gate = gate
+
+    def find_gate_by_id(self, gate_id):
+        return self.gate
+
+    def update_parking_lot_count(self, parking_lot):
+        pass
+
+    def save_ticket(self, ticket):
+        return ticket
+
+
+class TicketServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.lot, self.gate = make_lot([make_floor(1, [VehicleType.CAR] * 50)])
+        stub = _StubRepo(self.gate)
+        self.service = TicketService(stub, VehicleRepo(), SlotRepo(), stub, stub)
+
+    def test_rejects_vehicle_already_parked(self):
+        self.service.issueTicket("ka 01 ab 1", "owner", 1, VehicleType.CAR)
+        with self.assertRaises(Exception):
+            self.service.issueTicket("KA01AB1", "owner", 1, VehicleType.CAR)
+        self.assertEqual(self.lot.get_available_slots_count(VehicleType.CAR), 49)
+
+    def test_same_vehicle_from_many_gates_takes_one_slot(self):
+        barrier = threading.Barrier(8)
+        issued, rejected = [], []
+
+        def issue():
+            barrier.wait()
+            try:
+                issued.append(self.service.issueTicket("KA01AB1", "owner", 1, VehicleType.CAR))
+            except Exception:
+                rejected.append(1)
+
+        threads = [threading.Thread(target=issue) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual((len(issued), len(rejected)), (1, 7))
+        self.assertEqual(self.lot.get_available_slots_count(VehicleType.CAR), 49)
+        self.assertEqual(scan_available(self.lot, VehicleType.CAR), 49)
+
+    def test_failed_issue_releases_reservation(self):
+        with self.assertRaises(Exception):
+            self.service.issueTicket("KA01AB1", "owner", 1, VehicleType.TRUCK)
+        self.assertNotIn("KA01AB1", self.lot.parked_vehicles)
+
+    def test_close_ticket_frees_slot(self):
+        ticket = self.service.issueTicket("KA01AB1", "owner", 1, VehicleType.CAR)
+        self.assertEqual(self.service.closeTicket("ka01ab1", 1), 10)
+        self.assertEqual(ticket.slot.status, SlotStatus.EMPTY)
+        self.assertEqual(self.lot.get_available_slots_count(VehicleType.CAR), 50)
+        self.assertEqual(self.lot.active_tickets, {})
+        self.assertEqual(self.lot.parked_vehicles, {})
+
+    def test_close_ticket_reopens_full_lot(self):
+        lot, gate = make_lot([make_floor(1, [VehicleType.CAR])])
+        stub = _StubRepo(gate)
+        service = TicketService(stub, VehicleRepo(), SlotRepo(), ParkingLotRepo(), stub)
+        service.issueTicket("KA01AB1", "owner", 1, VehicleType.CAR)
+        self.assertEqual(lot.status, ParkingLotStatus.FULL)
+        service.closeTicket("KA01AB1", 1)
+        self.assertEqual(lot.status, ParkingLotStatus.OPEN)
+
+    def test_exit_before_entry_pays_base_fee(self):
+        ticket = self.service.issueTicket("KA01AB1", "owner", 1, VehicleType.CAR)
+        self.assertEqual(compute_fee(ticket, ticket.entry_ts - 1), BASE_FEE)
+
+
+if __name__ == "__main__":
+    unittest.main()